@@ -1,41 +1,216 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import SimpleNamespace
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Set,
+    Tuple,
+    Union,
+)
 import argparse
-import json
+import bisect
+import functools
 import logging
+import mmap
+import multiprocessing
 import os
 import re
 import time
 import importlib
+import importlib.util
+import itertools
 from pathlib import Path
 
-import pandas as pd
-from openpyxl.styles import Font
-from PyPDF2 import PdfReader
-
 from src.logger import get_logger
 from src.models import ValidationReport
+from src.utils import JSONL_READ_BUFFER, PYMUPDF_LOCK, loads_json
 from src.validate import load_chunks, load_toc, match_sections
 
+if TYPE_CHECKING:  # pandas, openpyxl and PyPDF2 are imported where they are used
+    import pandas as pd
+    from PyPDF2 import PdfReader
+
 LOG = get_logger(__name__)
 
 ID_LIST_RX = r"((?:\d+|[A-Z])(?:\.\d+)*[a-z]?)"
 ID_STRICT_RE = re.compile(r"(?:\d+(?:\.\d+)*|[A-Z](?:\.\d+)+)[a-z]?")
 TABLE_RX = re.compile(r"\bTable\s+\d+(?:\.\d+)?", re.IGNORECASE)
+FIG_LIST_RE = re.compile(rf"\bFigure\s+{ID_LIST_RX}\b", re.IGNORECASE)
+TAB_LIST_RE = re.compile(rf"\bTable\s+{ID_LIST_RX}\b", re.IGNORECASE)
+NUM_HEAD_RX = r"^(\d+)"
+NUM_HEAD_RE = re.compile(NUM_HEAD_RX)
+TABLE_TITLE_RE = re.compile(r"^\s*Table\s+\d+", re.IGNORECASE)
+BATCH_SEP = "\x00"
+
+JSONL_MIN_SPLIT_BYTES = 1 << 20
+AUTOFIT_SAMPLE_ROWS = 256
+
+try:
+    import fitz as _fitz  # PyMuPDF
+except ImportError:  # optional fastest PDF text backend; pypdfium2/PyPDF2 are fallbacks
+    _fitz = None
+
+try:
+    import pypdfium2 as _pdfium
+except ImportError:  # optional faster PDF text backend; PyPDF2 is the fallback
+    _pdfium = None
+
+# optional faster Excel engine; openpyxl is the fallback. Only probed here,
+# imported when a workbook is written.
+_HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+
+
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def _caption_list_re(fig_re: re.Pattern, tab_re: re.Pattern) -> re.Pattern:
+    """``(?P<fig>...)|(?P<tab>...)`` over the two list patterns, each keeping its own flags."""
+
+    def scoped(p: re.Pattern) -> str:
+        letters = "".join(c for flag, c in _SCOPED_FLAGS if p.flags & flag)
+        # a verbose pattern may end in a comment, which would swallow the closing paren
+        end = "\n" if p.flags & re.VERBOSE else ""
+        return f"(?{letters}:{p.pattern}{end})"
+
+    return re.compile(f"(?P<fig>{scoped(fig_re)})|(?P<tab>{scoped(tab_re)})")
+
+
+def _findall_item(m: re.Match, name: str, n_groups: int) -> Any:
+    """What ``findall`` would yield for the sub-pattern held in named group ``name``."""
+    outer = m.re.groupindex[name]
+    if n_groups == 0:
+        return m.group(outer)
+    if n_groups == 1:
+        return m.group(outer + 1)
+    return m.group(*range(outer + 1, outer + 1 + n_groups))
+
+
+def _page_offsets(lengths: Iterable[int]) -> List[int]:
+    """Start offset of each page in the pages joined with a one-character separator."""
+    starts = []
+    offset = 0
+    for n in lengths:
+        starts.append(offset)
+        offset += n + 1
+    return starts
+
+
+def _within(pages: List[int], starts: List[int], lo: int, hi: int, idx: range) -> bool:
+    """True when the span ``[lo, hi)`` of the joined pages lies on pages in ``idx``."""
+    first = pages[bisect.bisect_right(starts, lo) - 1]
+    last = pages[bisect.bisect_right(starts, hi - 1) - 1]
+    return first in idx and last in idx
+
+
+def _jsonl_worker_count(size: int, max_workers: Optional[int] = None) -> int:
+    """Number of byte ranges to split a JSONL buffer into (one per worker, >= 1 MiB each)."""
+    cap = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    return max(1, min(cap, size // JSONL_MIN_SPLIT_BYTES))
+
+
+def _split_on_newlines(buf: mmap.mmap, parts: int) -> List[Tuple[int, int]]:
+    """Cut ``buf`` into at most ``parts`` (start, end) ranges that end on line boundaries."""
+    size = len(buf)
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+    for k in range(1, parts):
+        target = max(start, size * k // parts)
+        nl = buf.find(b"\n", target)
+        if nl == -1:
+            break
+        bounds.append((start, nl + 1))
+        start = nl + 1
+    if start < size or not bounds:
+        bounds.append((start, size))
+    return bounds
+
+
+def _parallel_map_jsonl(
+    path: Path, fn: Callable[[Tuple[Any, ...]], Any], n_workers: Optional[int], *extra: Any
+) -> List[Any]:
+    """Apply ``fn`` to newline-aligned byte ranges of a JSONL file, one process per range.
+
+    ``fn`` receives ``(path, start, end, *extra)`` and must be a picklable
+    module-level function. Results come back in completion order. Workers are
+    spawned rather than forked: callers may run this from a worker thread while
+    other threads hold locks (logging, PDF backends) a forked child would inherit.
+    """
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        bounds = _split_on_newlines(buf, _jsonl_worker_count(len(buf), n_workers))
+    tasks = [(str(path), start, end, *extra) for start, end in bounds]
+    if len(tasks) == 1:
+        return [fn(tasks[0])]
+    with multiprocessing.get_context("spawn").Pool(len(tasks)) as pool:
+        return list(pool.imap_unordered(fn, tasks))
+
+
+def _batch_id_re(id_rx: re.Pattern) -> re.Pattern:
+    """Pattern whose group 1 is the first ``id_rx`` hit in each ``BATCH_SEP``-joined record."""
+    return re.compile(rf"(?:\A|{BATCH_SEP})[^{BATCH_SEP}]*?({id_rx.pattern})", id_rx.flags)
+
+
+BATCH_ID_STRICT_RE = _batch_id_re(ID_STRICT_RE)
+
+
+def _first_ids(batch_rx: re.Pattern, parts: List[str]) -> Set[str]:
+    """Same result as ``{id_rx.search(s).group(0) for s in parts}`` in a single regex scan."""
+    if not parts:
+        return set()
+    text = BATCH_SEP.join(parts)
+    if text.count(BATCH_SEP) != len(parts) - 1:  # a part contains the separator itself
+        text = BATCH_SEP.join(p.replace(BATCH_SEP, " ") for p in parts)
+    return {m.group(1) for m in batch_rx.finditer(text)}
+
+
+def _ids_in_jsonl_range(task: Tuple[str, int, int, re.Pattern]) -> Tuple[Set[str], Set[str]]:
+    """Collect strict figure/table IDs from the JSONL records in one byte range.
+
+    All figure (and table) strings of the range are joined and scanned once,
+    keeping the first ID of each string as a per-string search would.
+    """
+    path, start, end, id_rx = task
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+    fig_parts: List[str] = []
+    tab_parts: List[str] = []
+    for line in data.split(b"\n"):
+        if not line or line.isspace():
+            continue
+        rec = loads_json(line)
+        figures = rec.get("figures")
+        if figures:
+            fig_parts.extend(map(str, figures))
+        tables = rec.get("tables")
+        if tables:
+            tab_parts.extend(map(str, tables))
+    batch_rx = BATCH_ID_STRICT_RE if id_rx is ID_STRICT_RE else _batch_id_re(id_rx)
+    return _first_ids(batch_rx, fig_parts), _first_ids(batch_rx, tab_parts)
 
 
 def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
-    """Yield parsed JSON objects from a JSONL file (memory-friendly stream)."""
-    with path.open("r", encoding="utf-8") as fh:
+    """Yield parsed JSON objects from a JSONL file (memory-friendly stream).
+
+    Lines are read as bytes through a 1 MiB buffer and handed straight to the
+    decoder, skipping the utf-8 decode and per-line string copy.
+    """
+    with path.open("rb", buffering=JSONL_READ_BUFFER) as fh:
         for line in fh:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            yield json.loads(line)
+            yield loads_json(line)
 
 
 def read_jsonl(path: Path) -> List[Dict[str, Any]]:
@@ -43,10 +218,118 @@ def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     return list(iter_jsonl(path))
 
 
+class _Pdfium2Page:
+    """Page wrapper exposing PyPDF2's ``extract_text()`` on top of pypdfium2."""
+
+    def __init__(self, page: Any) -> None:
+        self._page = page
+
+    def extract_text(self) -> str:
+        textpage = self._page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+
+
+class _Pdfium2Pages:
+    """Lazy, indexable page sequence; pages are loaded only when accessed."""
+
+    def __init__(self, doc: Any) -> None:
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return len(self._doc)
+
+    def __getitem__(self, idx: int) -> _Pdfium2Page:
+        return _Pdfium2Page(self._doc[idx])
+
+
+class Pdfium2Reader:
+    """Minimal PdfReader-compatible reader (``.pages[i].extract_text()``) backed by PDFium."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._doc = _pdfium.PdfDocument(str(path))
+        self.pages = _Pdfium2Pages(self._doc)
+
+    def __str__(self) -> str:
+        return f"Pdfium2Reader(pages={len(self.pages)})"
+
+    def close(self) -> None:
+        self._doc.close()
+
+
+class _FitzPage:
+    """Page wrapper exposing PyPDF2's ``extract_text()`` on top of PyMuPDF.
+
+    The page is loaded, read and released under ``PYMUPDF_LOCK`` (MuPDF is not
+    thread-safe and the chunk stage may be using it on another thread).
+    """
+
+    def __init__(self, doc: Any, idx: int) -> None:
+        self._doc = doc
+        self._idx = idx
+
+    def extract_text(self) -> str:
+        with PYMUPDF_LOCK:
+            page = self._doc.load_page(self._idx)
+            text = page.get_text("text")
+            del page
+        return text
+
+
+class _FitzPages:
+    """Lazy, indexable page sequence; pages are loaded only when accessed."""
+
+    def __init__(self, doc: Any) -> None:
+        self._doc = doc
+        with PYMUPDF_LOCK:
+            self._count = doc.page_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx: int) -> _FitzPage:
+        if not -self._count <= idx < self._count:
+            raise IndexError(f"page index {idx} out of range")
+        return _FitzPage(self._doc, idx % self._count)
+
+
+class FitzReader:
+    """Minimal PdfReader-compatible reader (``.pages[i].extract_text()``) backed by MuPDF."""
+
+    def __init__(self, path: str | Path) -> None:
+        with PYMUPDF_LOCK:
+            self._doc = _fitz.open(str(path))
+        self.pages = _FitzPages(self._doc)
+
+    def __str__(self) -> str:
+        return f"FitzReader(pages={len(self.pages)})"
+
+    def close(self) -> None:
+        with PYMUPDF_LOCK:
+            self._doc.close()
+
+
+def open_pypdf2_reader(path: str | Path) -> PdfReader:
+    """Open a ``PyPDF2.PdfReader``, importing PyPDF2 only on first use."""
+    from PyPDF2 import PdfReader
+
+    return PdfReader(str(path))
+
+
+if _fitz is not None:
+    DEFAULT_READER_CLS: Any = FitzReader
+elif _pdfium is not None:
+    DEFAULT_READER_CLS = Pdfium2Reader
+else:
+    DEFAULT_READER_CLS = open_pypdf2_reader
+
+
 class AbstractExtractor(ABC):
     """Abstract base class for figure/table extractors."""
 
-    def __init__(self, reader_cls=PdfReader) -> None:
+    def __init__(self, reader_cls=DEFAULT_READER_CLS) -> None:
         self.reader_cls = reader_cls
 
     @abstractmethod
@@ -55,6 +338,7 @@ class AbstractExtractor(ABC):
         pdf_path: str | Path,
         lof_range: Tuple[int, int] = (18, 26),
         lot_range: Tuple[int, int] = (26, 33),
+        reader: Optional[PdfReader] = None,
     ) -> Tuple[Set[str], Set[str]]:
         raise NotImplementedError
 
@@ -72,15 +356,22 @@ class AbstractExtractor(ABC):
 
 
 class FigureTableExtractor(AbstractExtractor):
-    """Concrete extractor that finds figure and table IDs in PDFs/JSONL."""
+    """Concrete extractor that finds figure and table IDs in PDFs/JSONL.
 
-    _fig_pattern_template = rf"\bFigure\s+{ID_LIST_RX}\b"
-    _tab_pattern_template = rf"\bTable\s+{ID_LIST_RX}\b"
+    Instances hold only read-only state after ``__init__`` (compiled patterns and
+    settings), so one instance can be shared across threads and callers.
+    """
 
-    def __init__(self, reader_cls=PdfReader) -> None:
+    def __init__(
+        self,
+        reader_cls=DEFAULT_READER_CLS,
+        jsonl_workers: Optional[int] = None,
+    ) -> None:
         super().__init__(reader_cls=reader_cls)
-        self.fig_list_re = re.compile(self._fig_pattern_template, re.IGNORECASE)
-        self.tab_list_re = re.compile(self._tab_pattern_template, re.IGNORECASE)
+        self.jsonl_workers = jsonl_workers
+        self.fig_list_re = FIG_LIST_RE
+        self.tab_list_re = TAB_LIST_RE
+        self.caption_list_re = _caption_list_re(self.fig_list_re, self.tab_list_re)
         self.id_strict_re = ID_STRICT_RE
         self.table_rx = TABLE_RX
 
@@ -92,57 +383,109 @@ class FigureTableExtractor(AbstractExtractor):
             return NotImplemented
         return self.reader_cls == other.reader_cls
 
-    def _extract_text_range(
-        self, reader: PdfReader, start_idx: int, end_idx_excl: int
-    ) -> str:
-        parts: List[str] = []
-        for i in range(start_idx, min(end_idx_excl, len(reader.pages))):
+    def _extract_pages(self, reader: PdfReader, indices: Iterable[int]) -> Dict[int, str]:
+        """Extract text for each 0-based page index once; failed pages map to ''."""
+        texts: Dict[int, str] = {}
+        for i in indices:
             try:
-                parts.append(reader.pages[i].extract_text() or "")
+                texts[i] = reader.pages[i].extract_text() or ""
             except Exception:
                 LOG.exception("Failed to extract text from page %d", i)
-                parts.append("")
-        return "\n".join(parts)
+                texts[i] = ""
+        return texts
+
+    def _extract_text_range(
+        self, reader: PdfReader, start_idx: int, end_idx_excl: int
+    ) -> str:
+        indices = range(start_idx, min(end_idx_excl, len(reader.pages)))
+        texts = self._extract_pages(reader, indices)
+        return "\n".join(texts[i] for i in indices)
 
     def extract_from_pdf(
         self,
         pdf_path: str | Path,
         lof_range: Tuple[int, int] = (18, 26),
         lot_range: Tuple[int, int] = (26, 33),
+        reader: Optional[PdfReader] = None,
     ) -> Tuple[Set[str], Set[str]]:
-        reader = self.reader_cls(str(pdf_path))
-        lof_text = self._extract_text_range(reader, *lof_range)
-        lot_text = self._extract_text_range(reader, *lot_range)
-        figs = {m.group(1) for m in self.fig_list_re.finditer(lof_text)}
-        tabs = {m.group(1) for m in self.tab_list_re.finditer(lot_text)}
+        """Collect figure/table IDs from the List of Figures/Tables page ranges.
+
+        Pass an already-open ``reader`` to avoid parsing the PDF again.
+        """
+        if reader is None:
+            reader = self.reader_cls(str(pdf_path))
+        n_pages = len(reader.pages)
+        lof_idx = range(lof_range[0], min(lof_range[1], n_pages))
+        lot_idx = range(lot_range[0], min(lot_range[1], n_pages))
+        texts = self._extract_pages(reader, sorted(set(lof_idx) | set(lot_idx)))
+        figs, tabs = self._caption_ids_single_pass(texts, lof_idx, lot_idx)
         LOG.debug("extract_from_pdf: figs=%d tabs=%d", len(figs), len(tabs))
         return figs, tabs
 
-    def extract_from_jsonl(self, chunks_path: str | Path) -> Tuple[Set[str], Set[str]]:
-        """Stream chunks JSONL and extract strict figure/table IDs."""
+    def _caption_ids_single_pass(
+        self, texts: Dict[int, str], lof_idx: range, lot_idx: range
+    ) -> Tuple[Set[str], Set[str]]:
+        """Scan all LoF/LoT pages once with ``caption_list_re``, dispatching on the branch.
+
+        A match only counts when it starts and ends on pages of its own list, which
+        gives the same sets as running the figure/table regexes over each list's text
+        as long as a figure match and a table match never overlap.
+        """
+        pages = sorted(texts)
+        starts = _page_offsets(len(texts[i]) for i in pages)
+        combined = "\n".join(texts[i] for i in pages)
         figs: Set[str] = set()
         tabs: Set[str] = set()
-        for rec in iter_jsonl(Path(chunks_path)):
-            for s in rec.get("figures", []) or []:
-                m = self.id_strict_re.search(str(s))
-                if m:
-                    figs.add(m.group(0))
-            for s in rec.get("tables", []) or []:
-                m = self.id_strict_re.search(str(s))
-                if m:
-                    tabs.add(m.group(0))
+        n_fig, n_tab = self.fig_list_re.groups, self.tab_list_re.groups
+        for m in self.caption_list_re.finditer(combined):
+            if m.start("fig") != -1:
+                if _within(pages, starts, m.start(), m.end(), lof_idx):
+                    figs.add(_findall_item(m, "fig", n_fig))
+            elif _within(pages, starts, m.start(), m.end(), lot_idx):
+                tabs.add(_findall_item(m, "tab", n_tab))
+        return figs, tabs
+
+    def extract_from_jsonl(self, chunks_path: str | Path) -> Tuple[Set[str], Set[str]]:
+        """Extract strict figure/table IDs from a chunks JSONL.
+
+        The file is cut into newline-aligned byte ranges that worker processes
+        parse independently (JSON decoding and regex search hold the GIL); the
+        per-range ID sets are merged at the end.
+        """
+        path = Path(chunks_path)
+        if path.stat().st_size == 0:
+            return set(), set()
+        results = _parallel_map_jsonl(
+            path, _ids_in_jsonl_range, self.jsonl_workers, self.id_strict_re
+        )
+        figs: Set[str] = set().union(*(f for f, _ in results))
+        tabs: Set[str] = set().union(*(t for _, t in results))
         LOG.debug("extract_from_jsonl: figs=%d tabs=%d", len(figs), len(tabs))
         return figs, tabs
 
     def maxima_total(self, ids: Iterable[str]) -> int:
-        mx: Dict[str, int] = defaultdict(int)
+        """Sum, per top-level chapter, the highest trailing number seen (e.g. 5-1..5-7 -> 7)."""
+        # plain string scanning; same grammar as NUM_HEAD_RE on the last component
+        mx: Dict[str, int] = {}
+        n_ids = 0
         for s in ids:
-            head = s.split(".", 1)[0]
-            tail = re.match(r"(\d+)", s.split(".")[-1])
-            if tail:
-                mx[head] = max(mx[head], int(tail.group(1)))
+            n_ids += 1
+            head, sep, rest = s.partition(".")
+            last = rest.rpartition(".")[2] if sep else head
+            if last.isdecimal():
+                v = int(last)
+            else:
+                i = 0
+                n = len(last)
+                while i < n and last[i].isdecimal():
+                    i += 1
+                if not i:
+                    continue
+                v = int(last[:i])
+            if v > mx.get(head, 0):
+                mx[head] = v
         total = sum(mx.values())
-        LOG.debug("maxima_total: total=%d based_on=%d_ids", total, len(list(ids)))
+        LOG.debug("maxima_total: total=%d based_on=%d_ids", total, n_ids)
         return total
 
     def count_tables_in_chunk(self, rec: Dict[str, Any]) -> int:
@@ -154,88 +497,234 @@ class FigureTableExtractor(AbstractExtractor):
         return len(self.table_rx.findall(str(txt)))
 
 
+_extractor: FigureTableExtractor = FigureTableExtractor()
+
+
 def _extract_text_range(reader: PdfReader, start_idx: int, end_idx_excl: int) -> str:
-    return FigureTableExtractor()._extract_text_range(reader, start_idx, end_idx_excl)
+    return _extractor._extract_text_range(reader, start_idx, end_idx_excl)
 
 
 def _maxima_total(ids: Iterable[str]) -> int:
-    return FigureTableExtractor().maxima_total(ids)
+    return _extractor.maxima_total(ids)
 
 
 def figure_table_metrics_from_pdf(
     pdf_path: str | Path,
     lof_range: Tuple[int, int] = (18, 26),
     lot_range: Tuple[int, int] = (26, 33),
+    reader: Optional[PdfReader] = None,
 ) -> Tuple[Set[str], Set[str]]:
-    extractor = FigureTableExtractor()
-    return extractor.extract_from_pdf(pdf_path, lof_range=lof_range, lot_range=lot_range)
+    return _extractor.extract_from_pdf(
+        pdf_path, lof_range=lof_range, lot_range=lot_range, reader=reader
+    )
 
 
 def figure_table_ids_from_jsonl(chunks_path: str | Path) -> Tuple[Set[str], Set[str]]:
-    extractor = FigureTableExtractor()
-    return extractor.extract_from_jsonl(chunks_path)
+    return _extractor.extract_from_jsonl(chunks_path)
 
 
 def count_tables_in_chunk(rec: Dict[str, Any]) -> int:
-    return FigureTableExtractor().count_tables_in_chunk(rec)
+    return _extractor.count_tables_in_chunk(rec)
 
 
+@functools.lru_cache(maxsize=8192)
 def title_looks_like_table(t: Optional[str]) -> bool:
-    return bool(re.match(r"^\s*Table\s+\d+", (t or ""), flags=re.IGNORECASE))
+    return bool(TABLE_TITLE_RE.match(t or ""))
+
+
+def id_sort_key(s: str) -> Tuple[Tuple[int, int, str], ...]:
+    """Natural sort key for figure/table IDs (``2.1`` < ``10.1``; lettered IDs after numbers).
+
+    Each ``.``/``-`` component becomes ``(0, number, suffix)`` or ``(1, 0, text)`` so
+    mixed components never compare int against str.
+    """
+    key = []
+    for part in s.replace("-", ".").split("."):
+        digits = len(part) - len(part.lstrip("0123456789"))
+        if digits:
+            key.append((0, int(part[:digits]), part[digits:]))
+        else:
+            key.append((1, 0, part))
+    return tuple(key)
+
+
+class SingleColumnSheet(NamedTuple):
+    """A one-column sheet written straight to the worksheet, without a DataFrame."""
+
+    header: str
+    values: Sequence[str]
+
+
+class RowsSheet(NamedTuple):
+    """A small table given as header names plus row tuples (no DataFrame needed)."""
+
+    headers: Sequence[str]
+    rows: Sequence[Sequence[Any]]
+
+
+Sheet = Union["pd.DataFrame", SingleColumnSheet, RowsSheet]
+
+
+class WidthTracker:
+    """Running per-column display widths (header or longest value, +2, capped)."""
+
+    def __init__(self, headers: Sequence[Any], max_width: int) -> None:
+        self.max_width = max_width
+        self._longest = [len(str(h)) for h in headers]
+
+    def feed(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Widen columns to fit ``rows``; ``None`` cells count as empty."""
+        longest = self._longest
+        for idx, col in enumerate(zip(*rows)):
+            if None in col:
+                col = [v for v in col if v is not None]
+            n = max(map(len, map(str, col)), default=0)
+            if n > longest[idx]:
+                longest[idx] = n
+
+    def widths(self) -> List[int]:
+        return [min(n + 2, self.max_width) for n in self._longest]
 
 
 class AbstractWriter(ABC):
     """Abstract base class for writers (e.g. ExcelWriter)."""
 
     @abstractmethod
-    def write(self, target: str | Path, sheets: Dict[str, pd.DataFrame]) -> None:
+    def write(self, target: str | Path, sheets: Mapping[str, Sheet]) -> None:
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=None)
+def _header_font() -> Any:
+    """The bold openpyxl header font, shared by every writer and sheet."""
+    from openpyxl.styles import Font
+
+    return Font(bold=True)
+
+
 class ExcelWriter(AbstractWriter):
-    """Concrete Excel writer implementing AbstractWriter."""
+    """Concrete Excel writer implementing AbstractWriter.
+
+    Uses the xlsxwriter engine when installed (faster cell serialisation) and
+    openpyxl otherwise; pass ``engine="openpyxl"`` to force the old path.
+    """
 
-    def __init__(self, max_width: int = 60) -> None:
+    def __init__(self, max_width: int = 60, engine: Optional[str] = None) -> None:
         self.max_width = max_width
-        self.header_font = Font(bold=True)
+        self.engine = engine or ("xlsxwriter" if _HAS_XLSXWRITER else "openpyxl")
+
+    @property
+    def header_font(self) -> Any:
+        return _header_font()
 
     def __str__(self) -> str:
-        return f"ExcelWriter(max_width={self.max_width})"
+        return f"ExcelWriter(max_width={self.max_width}, engine={self.engine})"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ExcelWriter):
             return NotImplemented
-        return self.max_width == other.max_width
-
-    def _autofit(self, ws: Any) -> None:
-        for cell in ws[1]:
-            cell.font = self.header_font
-
-        for col in ws.columns:
-            values = [str(c.value) if c.value is not None else "" for c in col]
-            width = min(max((len(v) for v in values), default=0) + 2, self.max_width)
-            ws.column_dimensions[col[0].column_letter].width = width
-
-    def write(self, target: str | Path, sheets: Dict[str, pd.DataFrame]) -> None:
+        return self.max_width == other.max_width and self.engine == other.engine
+
+    def _layout(self, data: Sheet) -> Tuple[List[Any], List[int], Iterator[Sequence[Any]]]:
+        """Return ``(headers, column widths, rows)`` for any supported sheet type.
+
+        Widths are measured on the first ``AUTOFIT_SAMPLE_ROWS`` row tuples as they
+        are pulled for writing; those rows are then replayed ahead of the rest.
+        """
+        if isinstance(data, SingleColumnSheet):
+            headers: List[Any] = [data.header]
+            rows: Iterator[Sequence[Any]] = ((v,) for v in data.values)
+        elif isinstance(data, RowsSheet):
+            headers, rows = list(data.headers), iter(data.rows)
+        else:
+            # missing values become blank cells, as with to_excel(na_rep="")
+            cells = data.astype(object).where(data.notna(), None)
+            headers, rows = list(data.columns), cells.itertuples(index=False, name=None)
+        head = list(itertools.islice(rows, AUTOFIT_SAMPLE_ROWS))
+        tracker = WidthTracker(headers, self.max_width)
+        tracker.feed(head)
+        return headers, tracker.widths(), itertools.chain(head, rows)
+
+    def write(self, target: str | Path, sheets: Mapping[str, Sheet]) -> None:
+        """Write sheets in order.
+
+        An existing file is truncated by the engine on save. With either engine a
+        locked or read-only target raises ``PermissionError`` (xlsxwriter's
+        ``FileCreateError`` is translated in ``_write_xlsxwriter``).
+        """
         target_path = Path(target)
-        if target_path.exists():
-            try:
-                target_path.unlink()
-            except PermissionError:
-                LOG.debug(
-                    "Permission to remove existing file %s denied; will try writing anyway",
-                    target_path,
-                )
-        with pd.ExcelWriter(target_path, engine="openpyxl") as writer:
-            for name, df in sheets.items():
-                df.to_excel(writer, sheet_name=name, index=False)
-            wb = writer.book
-            for name in sheets.keys():
-                self._autofit(wb[name])
+        if self.engine == "openpyxl":
+            self._write_openpyxl(target_path, sheets)
+        else:
+            self._write_xlsxwriter(target_path, sheets)
+
+    def _write_xlsxwriter(self, target: Path, sheets: Mapping[str, Sheet]) -> None:
+        """Write rows straight into an xlsxwriter workbook (no ``to_excel`` round trip).
+
+        Rows are emitted strictly top to bottom, so ``constant_memory`` can flush
+        each row to disk as soon as the next one starts. The target is only opened
+        by ``close()``, which is skipped when writing a sheet fails so no partial
+        report is left behind.
+        """
+        import xlsxwriter
+        from xlsxwriter.exceptions import FileCreateError
+
+        wb = xlsxwriter.Workbook(
+            str(target), {"constant_memory": True, "nan_inf_to_errors": True}
+        )
+        header_fmt = wb.add_format({"bold": True})
+        for name, sheet in sheets.items():
+            headers, widths, rows = self._layout(sheet)
+            ws = wb.add_worksheet(name)
+            for idx, width in enumerate(widths):
+                ws.set_column(idx, idx, int(width))
+            ws.write_row(0, 0, [str(h) for h in headers], header_fmt)
+            for r, row in enumerate(rows, start=1):
+                ws.write_row(r, 0, row)
+        try:
+            wb.close()
+        except FileCreateError as e:
+            # xlsxwriter wraps the OSError from opening the target; surface a
+            # locked/read-only file as PermissionError like the openpyxl path
+            cause = e.args[0] if e.args else e.__context__
+            if isinstance(cause, PermissionError):
+                raise PermissionError(cause.errno, cause.strerror, cause.filename) from cause
+            raise
+
+    def _write_openpyxl(self, target: Path, sheets: Mapping[str, Sheet]) -> None:
+        """Stream every sheet through an openpyxl write-only workbook (no in-memory cell tree).
+
+        Write-only sheets emit their column widths before the first row; ``_layout``
+        measures them on the leading rows before any row is appended.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        wb = Workbook(write_only=True)
+        for name, sheet in sheets.items():
+            headers, widths, rows = self._layout(sheet)
+            ws = wb.create_sheet(name)
+            for idx, width in enumerate(widths, start=1):
+                ws.column_dimensions[get_column_letter(idx)].width = int(width)
+            header_cells = []
+            for h in headers:
+                cell = WriteOnlyCell(ws, value=str(h))
+                cell.font = self.header_font
+                header_cells.append(cell)
+            ws.append(header_cells)
+            for row in rows:
+                ws.append(row)
+        wb.save(target)
 
 
 class Orchestrator:
-    """Orchestrates ToC extraction, chunking, validation and Excel reporting."""
+    """Orchestrates ToC extraction, chunking, validation and Excel reporting.
+
+    The default figure/table extractor reads the PDF with PyMuPDF when it is
+    installed, then pypdfium2 (both much faster text extraction), and PyPDF2
+    otherwise; inject an extractor with ``reader_cls=open_pypdf2_reader`` to force PyPDF2.
+    """
 
     def __init__(
         self,
@@ -247,6 +736,7 @@ class Orchestrator:
         validation_report_class: Any = ValidationReport,
         figure_table_extractor: Optional[AbstractExtractor] = None,
         excel_writer: Optional[AbstractWriter] = None,
+        workers: Optional[int] = None,
     ) -> None:
         self.cmd_toc_fn = cmd_toc_fn
         self.cmd_chunk_fn = cmd_chunk_fn
@@ -256,9 +746,12 @@ class Orchestrator:
         self.validationreport = validation_report_class
 
         self.figure_table_extractor: AbstractExtractor = (
-            figure_table_extractor or FigureTableExtractor()
+            figure_table_extractor or _extractor
         )
         self.excel_writer: AbstractWriter = excel_writer or ExcelWriter()
+        self._reader_cache: Dict[str, PdfReader] = {}
+        # forwarded to the chunk stage; None keeps the chunk builder's default
+        self.workers = workers
 
         if self.cmd_toc_fn is None or self.cmd_chunk_fn is None:
             try:
@@ -298,6 +791,45 @@ class Orchestrator:
             and self.excel_writer == other.excel_writer
         )
 
+    def _get_reader(self, pdf_path: str | Path) -> PdfReader:
+        """Return the reader for ``pdf_path``, parsing the PDF only on first use.
+
+        Readers are keyed by absolute path, so relative and absolute spellings
+        of the same file share one parsed document.
+        """
+        key = str(Path(pdf_path).resolve())
+        reader = self._reader_cache.get(key)
+        if reader is None:
+            reader = self.figure_table_extractor.reader_cls(key)
+            self._reader_cache[key] = reader
+        return reader
+
+    def _close_readers(self, keep: Iterable[str] = ()) -> None:
+        """Close and forget cached readers except those keyed in ``keep``.
+
+        PyPDF2 readers have nothing to close and are just dropped.
+        """
+        keep = set(keep)
+        readers = {k: r for k, r in self._reader_cache.items() if k not in keep}
+        self._reader_cache = {k: r for k, r in self._reader_cache.items() if k in keep}
+        for reader in readers.values():
+            close = getattr(reader, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    LOG.debug("Failed to close PDF reader %s", reader, exc_info=True)
+
+    def _extract_pdf_ids(self, pdf_path: str | Path) -> Tuple[Set[str], Set[str]]:
+        """LoF/LoT figure and table IDs, read through the cached reader for ``pdf_path``.
+
+        Meant to be submitted to a pool: the reader is opened (the full PDF parse)
+        on the worker, not on the submitting thread.
+        """
+        return self.figure_table_extractor.extract_from_pdf(
+            pdf_path, reader=self._get_reader(pdf_path)
+        )
+
     def run_toc(
         self, pdf: str, toc_pages: Optional[str], doc_title: str, out_path: str
     ) -> None:
@@ -319,7 +851,7 @@ class Orchestrator:
         self.cmd_toc_fn(ns)
 
     def run_chunk(self, pdf: str, toc_path: str, out_path: str) -> None:
-        ns = SimpleNamespace(pdf=pdf, toc=toc_path, out=out_path)
+        ns = SimpleNamespace(pdf=pdf, toc=toc_path, out=out_path, workers=self.workers)
         LOG.info("Running chunk extraction -> %s", out_path)
 
         if self.cmd_chunk_fn is None:
@@ -336,18 +868,21 @@ class Orchestrator:
         tabs_toc: Set[str],
         figs_chunks: Set[str],
         tabs_chunks: Set[str],
-    ) -> Dict[str, pd.DataFrame]:
-        """Return a dict of sheet_name -> DataFrame for the validation Excel."""
+    ) -> Dict[str, Sheet]:
+        """Return a dict of sheet_name -> sheet data for the validation Excel.
+
+        No DataFrames are built: the list sheets are ``SingleColumnSheet`` tuples and
+        Overview is a two-column ``RowsSheet``.
+        """
         fig_matched = len(figs_toc & figs_chunks)
         tab_matched = len(tabs_toc & tabs_chunks)
-        fig_missing = sorted(figs_toc - figs_chunks)
-        tab_missing = sorted(tabs_toc - tabs_chunks)
-        fig_extra = sorted(figs_chunks - figs_toc)
-        tab_extra = sorted(tabs_chunks - tabs_toc)
+        fig_missing = sorted(figs_toc - figs_chunks, key=id_sort_key)
+        tab_missing = sorted(tabs_toc - tabs_chunks, key=id_sort_key)
+        fig_extra = sorted(figs_chunks - figs_toc, key=id_sort_key)
+        tab_extra = sorted(tabs_chunks - tabs_toc, key=id_sort_key)
 
         figs_range_total = self.figure_table_extractor.maxima_total(figs_toc)
         tabs_range_total = self.figure_table_extractor.maxima_total(tabs_toc)
-
         overview_rows = [
             ("Total sections (ToC)", report.toc_section_count),
             ("Total sections (ToC_Specs)", report.parsed_section_count),
@@ -364,88 +899,137 @@ class Orchestrator:
             ("Missing figure IDs in ToC_Specs", len(fig_missing)),
             ("Missing table IDs in ToC_Specs", len(tab_missing)),
         ]
-        overview_df = pd.DataFrame(overview_rows, columns=["Metric", "Value"])
-
-        sheets = {
-            "Overview": overview_df,
-            "MissingSections": pd.DataFrame({"section": report.missing_sections}),
-            "ExtraSections": pd.DataFrame({"section": report.extra_sections}),
-            "OutOfOrder": pd.DataFrame({"section": report.out_of_order_sections}),
-            "MatchedSections": pd.DataFrame({"section": report.matched_sections}),
-            "MissingFigureIDs": pd.DataFrame({"figure_id_missing": fig_missing}),
-            "MissingTableIDs": pd.DataFrame({"table_id_missing": tab_missing}),
-            "ExtraFigureIDs": pd.DataFrame({"figure_id_extra": fig_extra}),
-            "ExtraTableIDs": pd.DataFrame({"table_id_extra": tab_extra}),
+
+        return {
+            "Overview": RowsSheet(("Metric", "Value"), overview_rows),
+            "MissingSections": SingleColumnSheet("section", report.missing_sections),
+            "ExtraSections": SingleColumnSheet("section", report.extra_sections),
+            "OutOfOrder": SingleColumnSheet("section", report.out_of_order_sections),
+            "MatchedSections": SingleColumnSheet("section", report.matched_sections),
+            "MissingFigureIDs": SingleColumnSheet("figure_id_missing", fig_missing),
+            "MissingTableIDs": SingleColumnSheet("table_id_missing", tab_missing),
+            "ExtraFigureIDs": SingleColumnSheet("figure_id_extra", fig_extra),
+            "ExtraTableIDs": SingleColumnSheet("table_id_extra", tab_extra),
         }
-        return sheets
 
-    def _safe_write_excel(self, xls_path: str, sheets: Dict[str, pd.DataFrame]) -> None:
-        """Attempt to write Excel file and fall back to timestamped alternate on PermissionError."""
+    def _safe_write_excel(self, xls_path: str, sheets: Mapping[str, Sheet]) -> None:
+        """Attempt to write Excel file and fall back to timestamped alternate on PermissionError.
+
+        The same ``sheets`` mapping is reused for every attempt.
+        """
         target_path = Path(xls_path)
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            self._write_excel_with_autofit(xls_path, sheets)
-            LOG.info("Wrote validation Excel -> %s", xls_path)
-        except PermissionError:
-            alt = target_path.parent / f"ValidationReport_{time.strftime('%Y%m%d_%H%M%S')}.xlsx"
-            LOG.warning("Could not write %s (maybe file open). Writing to %s", xls_path, alt)
-            self._write_excel_with_autofit(str(alt), sheets)
-            LOG.info("Wrote validation Excel -> %s", alt)
+        for attempt in self._excel_targets(target_path):
+            try:
+                self._write_excel_with_autofit(str(attempt), sheets)
+            except PermissionError:
+                LOG.warning("Could not write %s (maybe file open)", attempt)
+                continue
+            LOG.info("Wrote validation Excel -> %s", attempt)
+            return
+        raise PermissionError(f"Could not write validation Excel to {xls_path} or an alternate path")
+
+    @staticmethod
+    def _excel_targets(target_path: Path) -> Iterator[Path]:
+        """Yield the report path, then (only if needed) a timestamped alternate beside it."""
+        yield target_path
+        yield target_path.parent / f"ValidationReport_{time.strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     def write_validation_xls_from_validate(
-        self, toc_path: str, chunks_path: str, xls_path: str, pdf_path: str
+        self,
+        toc_path: str,
+        chunks_path: str,
+        xls_path: str,
+        pdf_path: str,
+        pdf_ids: Optional[Tuple[Set[str], Set[str]]] = None,
     ) -> None:
-        """Load ToC & chunks, validate, extract figure/table IDs and write Excel report."""
-        LOG.info("Loading ToC from %s", toc_path)
-        toc = self.load_toc_fn(toc_path)
-        LOG.info("Loading chunks from %s", chunks_path)
-        chunks = self.load_chunks_fn(chunks_path)
-
-        missing, extra, out_of_order, matched = self.match_sections_fn(
-            toc, chunks, fuzzy_threshold=0.90, prefer_section_id=True
-        )
+        """Load ToC & chunks, validate, extract figure/table IDs and write Excel report.
+
+        ``pdf_ids`` may carry the (figures, tables) IDs already scanned from the PDF
+        List of Figures/Tables; when omitted they are extracted here.
+
+        The PDF ID scan does not depend on section matching, so it runs on a worker
+        thread while the chunks-JSONL IDs are scanned and the ToC and chunks are
+        loaded and matched. The JSONL scan may start worker processes and so
+        stays on the calling thread.
+        """
+        # readers opened here (not ones already cached, e.g. by run_all) are closed here
+        cached = set(self._reader_cache)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                if pdf_ids is None:
+                    pdf_ids_future: Future = pool.submit(self._extract_pdf_ids, pdf_path)
+                figs_chunks, tabs_chunks = self.figure_table_extractor.extract_from_jsonl(
+                    chunks_path
+                )
 
-        report = self.validationreport(
-            toc_section_count=len(toc),
-            parsed_section_count=len(chunks),
-            missing_sections=missing,
-            extra_sections=extra,
-            out_of_order_sections=out_of_order,
-            matched_sections=matched,
-        )
+                LOG.info("Loading ToC from %s", toc_path)
+                toc = self.load_toc_fn(toc_path)
+                LOG.info("Loading chunks from %s", chunks_path)
+                chunks = self.load_chunks_fn(chunks_path)
 
-        figs_toc, tabs_toc = self.figure_table_extractor.extract_from_pdf(pdf_path)
-        figs_chunks, tabs_chunks = self.figure_table_extractor.extract_from_jsonl(chunks_path)
+                missing, extra, out_of_order, matched = self.match_sections_fn(
+                    toc, chunks, fuzzy_threshold=0.90, prefer_section_id=True
+                )
+
+                report = self.validationreport(
+                    toc_section_count=len(toc),
+                    parsed_section_count=len(chunks),
+                    missing_sections=missing,
+                    extra_sections=extra,
+                    out_of_order_sections=out_of_order,
+                    matched_sections=matched,
+                )
 
-        sheets = self._build_report_dataframes(report, figs_toc, tabs_toc, figs_chunks, tabs_chunks)
+                figs_toc, tabs_toc = pdf_ids if pdf_ids is not None else pdf_ids_future.result()
+        finally:
+            self._close_readers(keep=cached)
 
+        sheets = self._build_report_dataframes(
+            report, figs_toc, tabs_toc, figs_chunks, tabs_chunks
+        )
         self._safe_write_excel(xls_path, sheets)
 
     def _write_excel_with_autofit(
-        self, target: str | Path, sheets: Dict[str, pd.DataFrame]
+        self, target: str | Path, sheets: Mapping[str, Sheet]
     ) -> None:
         self.excel_writer.write(target, sheets)
 
     def run_all(
         self, pdf: str, doc_title: str, outdir: str, toc_pages: Optional[str] = None
     ) -> Tuple[str, str, str]:
+        """Run ToC -> chunks -> validation, overlapping independent stages.
+
+        The List of Figures/Tables scan only needs the PDF, so it runs on a worker
+        thread while the ToC and chunk stages (which depend on each other) proceed.
+        PDF readers opened for the run are closed when it finishes.
+        """
         outdir_path = Path(outdir)
         outdir_path.mkdir(parents=True, exist_ok=True)
         toc_path = outdir_path / "usb_pd_toc.jsonl"
-        self.run_toc(
-            pdf=pdf, toc_pages=toc_pages, doc_title=doc_title, out_path=str(toc_path)
-        )
-        LOG.info("[1/3] ToC -> %s", toc_path)
-
         chunks_path = outdir_path / "usb_pd_spec.jsonl"
-        self.run_chunk(pdf=pdf, toc_path=str(toc_path), out_path=str(chunks_path))
-        LOG.info("[2/3] Chunks -> %s", chunks_path)
-
         xls_path = outdir_path / "ValidationReport.xlsx"
-        self.write_validation_xls_from_validate(
-            str(toc_path), str(chunks_path), str(xls_path), pdf
-        )
-        LOG.info("[3/3] Validation Excel -> %s", xls_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pdf_ids_future = pool.submit(self._extract_pdf_ids, pdf)
+
+                self.run_toc(
+                    pdf=pdf, toc_pages=toc_pages, doc_title=doc_title, out_path=str(toc_path)
+                )
+                LOG.info("[1/3] ToC -> %s", toc_path)
+
+                self.run_chunk(pdf=pdf, toc_path=str(toc_path), out_path=str(chunks_path))
+                LOG.info("[2/3] Chunks -> %s", chunks_path)
+
+                pdf_ids = pdf_ids_future.result()
+
+            self.write_validation_xls_from_validate(
+                str(toc_path), str(chunks_path), str(xls_path), pdf, pdf_ids=pdf_ids
+            )
+            LOG.info("[3/3] Validation Excel -> %s", xls_path)
+        finally:
+            self._close_readers()
         return str(toc_path), str(chunks_path), str(xls_path)
 
 
@@ -463,6 +1047,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument(
         "--toc-pages", default=None, help="Optional ToC page range like '13-18'"
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for chunk post-processing and chunks JSONL scans (1 disables fan-out)",
+    )
     args = ap.parse_args(argv)
 
     cmd_toc_fn = None
@@ -477,7 +1067,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         cmd_chunk_fn = getattr(run_mod, "cmd_chunk", None)
         LOG.debug("Loaded cmd_toc=%s cmd_chunk=%s from src.run", bool(cmd_toc_fn), bool(cmd_chunk_fn))
 
-    orchestrator = Orchestrator(cmd_toc_fn=cmd_toc_fn, cmd_chunk_fn=cmd_chunk_fn)
+    extractor = FigureTableExtractor(jsonl_workers=args.workers)
+    orchestrator = Orchestrator(
+        cmd_toc_fn=cmd_toc_fn,
+        cmd_chunk_fn=cmd_chunk_fn,
+        figure_table_extractor=extractor,
+        workers=args.workers,
+    )
     try:
         orchestrator.run_all(
             pdf=args.pdf, doc_title=args.doc_title, outdir=args.outdir, toc_pages=args.toc_pages
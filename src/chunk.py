@@ -1,12 +1,32 @@
 from __future__ import annotations
-import json
+import bisect
+import multiprocessing
+import os
 import re
 from abc import ABC, abstractmethod
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List, Optional, Set, Tuple
 
+from src.logger import get_logger
 from src.models import Caption, Chunk, ToCEntry
-from src.utils import looks_like_heading, normalize_text, strip_dot_leaders
+from src.utils import looks_like_heading, normalize_text, strip_dot_leaders, write_jsonl_records
+
+try:
+    import hyperscan as _hyperscan
+except ImportError:  # optional batch prefilter for caption enrichment; `re` is the fallback
+    _hyperscan = None
+
+LOG = get_logger(__name__)
+
+PARALLEL_MIN_CHUNKS = 16
+MAX_CHUNK_WORKERS = 8
+
+# (filtered lines, section_id, title, pstart, pend)
+_ChunkItem = Tuple[List[str], str, str, int, int]
+# (first page number, kept lines per page indexed by page - first)
+_PageLines = Tuple[int, List[List[str]]]
 
 class PDFRegexes:
     """Encapsulate all PDF-related regex patterns."""
@@ -22,19 +42,215 @@ class PDFRegexes:
     PUNCT_RUN = re.compile(r"[.\u00B7•]{3,}")
     ISOLATED_LETTERS = re.compile(r"(?:\b[A-Za-z]\b[.\s]*){6,}")
     PAGE_NO_NOISY = re.compile(r"P\s*a\s*g\s*e\s*\d+", re.IGNORECASE)
-    DOT_LEADERS_RUN = re.compile(r"(?:\s*[.\u00B7•]\s*){3,}")
-    TRAILING_LEADERS_PAGE = re.compile(r"(?:\s*[.\u00B7•]\s*){2,}\s*\d+\s*$")
+    # same languages as (?:\s*[.·•]\s*){3,} and (?:\s*[.·•]\s*){2,}\s*\d+\s*$, written so each
+    # whitespace run has one owner; the nested form backtracks exponentially on ". . . . x"
+    DOT_LEADERS_RUN = re.compile(r"\s*[.\u00B7•](?:\s*[.\u00B7•]){2,}\s*")
+    TRAILING_LEADERS_PAGE = re.compile(r"\s*[.\u00B7•](?:\s*[.\u00B7•])+\s*\d+\s*$")
     MULTI_SPACE_RE = re.compile(r"\s{2,}")
-    DASH_NORMALIZE = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2212]")
-    NBSP_FIX = re.compile(r"[\u00A0\u202F]")
+    # trailing "..... 12" page refs are dropped; other dot runs and space runs become " "
+    LINE_NOISE = re.compile(
+        rf"(?P<trail>{TRAILING_LEADERS_PAGE.pattern})|{DOT_LEADERS_RUN.pattern}|{MULTI_SPACE_RE.pattern}"
+    )
     USB_SPEC_PATTERN = re.compile(
         r"Universal Serial Bus Power Delivery Specification", re.IGNORECASE
     )
-    TABLE_FIGURE_LOOKAHEAD = r"(?=(?:\s*[A-Z]\.)|\s*\d)"
-    HEADING_RE = re.compile(
-        r"^\s*(?P<num>(?:\d+(?:\.\d+)*|[A-Z](?:\.\d+)*))\s+(?P<title>.+?)\s*$"
+    # necessary for any caption: norm_caption_line only closes whitespace inside the word
+    CAPTION_WORD_HINT = re.compile(r"(?i)T\s*a\s*b\s*l\s*e|F\s*i\s*g\s*u\s*r\s*e")
+    # norm_caption_line in one pass: whitespace runs and NBSP -> " ", unicode dashes -> "-",
+    # letter-spaced "T a b l e" / "F i g u r e" -> canonical word, and a space forced
+    # (absorbing any existing gap) between Table/Figure and a following "4" or "A." id
+    CAPTION_NORM = re.compile(
+        r"(?P<ws>\s{2,})|(?P<nbsp>[\u00A0\u202F])|(?P<dash>[\u2010-\u2014\u2212])"
+        r"|(?:(?P<spaced>\bT\s*a\s*b\s*l\s*e\b|\bF\s*i\s*g\s*u\s*r\s*e\b)"
+        r"|(?P<glued>Table|Figure)(?=\s*[A-Z]\.|\s*\d))(?P<gap>\s*(?=[A-Z]\.|\d))?",
+        re.IGNORECASE,
+    )
+    # deletion table for whitespace (every str.isspace() char sits below U+3001) plus . - · • _
+    HEADER_NOISE_TABLE = dict.fromkeys([c for c in range(0x3001) if chr(c).isspace()] + list(map(ord, ".-·•_")))
+    HYPHEN_BREAK = re.compile(r"(\S)-\n([a-z])")
+    DASH_BREAK = re.compile(r"(\S)[\-\u2010-\u2014\u2212]\n(\S)")
+    # dash + newline pairs DASH_BREAK can match; checked with `in` before running it
+    DASH_NEWLINES = tuple(d + "\n" for d in "-\u2010\u2011\u2012\u2013\u2014\u2212")
+    # union of HYPHEN_BREAK and DASH_BREAK with the dash captured; see _join_line_breaks
+    LINE_BREAK = re.compile(r"(\S)([\-\u2010-\u2014\u2212])\n(\S)")
+    LONE_SLASH = re.compile(r"(?<!\w)/(?!\w)")
+    CAMEL_SPLIT = re.compile(r"([a-z0-9])([A-Z])")
+    QUOTE_PAD = re.compile(r'\s*"([^"]+)"\s*')
+    # normalize_sentences in one pass: whitespace before "," / "." is dropped, any other
+    # run of 2+ whitespace chars or a newline becomes " "
+    SENTENCE_SPACING = re.compile(r"\s+(?P<punct>[,.])|\s{2,}|\n")
+    HAS_LETTER = re.compile(r"[A-Za-z]")
+    # one anchored match per content line: a Table/Figure mention anywhere wins ("keep"),
+    # otherwise numbered headings, spec running headers and "Page N" lines are dropped
+    CONTENT_LINE_FILTER = re.compile(
+        r"^(?:(?P<keep>(?=.*?\b(?:Table|Figure)\b))"
+        r"|(?P<drop>\d+(?:\.\d+)*\s+."
+        rf"|(?=.*?{USB_SPEC_PATTERN.pattern})"
+        r"|Page\s+\d+\s*$))",
+        re.IGNORECASE,
+    )
+    HEADING_NUM_RE = re.compile(r"^\s*(?P<num>\d+(?:\.\d+)*)\s+(?P<title>.+?)\s*$")
+    HEADING_ALPHA_RE = re.compile(r"^\s*(?P<num>[A-Z](?:\.\d+)*)\s+(?P<title>.+?)\s*$")
+    BULLET_CHARS = ("", "", "●", "▪", "", "", "", "", "•")
+    BULLET_TABLE = str.maketrans(dict.fromkeys(BULLET_CHARS, "- "))
+
+
+def _line_noise_repl(m: re.Match) -> str:
+    return "" if m.lastgroup == "trail" else " "
+
+
+def _join_line_breaks(text: str) -> str:
+    """HYPHEN_BREAK then DASH_BREAK in one pass over the text.
+
+    Both patterns match the same "x<dash><newline>y" window: "-" before a lowercase ASCII letter
+    is joined, anything else gets a space. The passes only disagree when one window's
+    trailing character starts the next window, since each pass consumes it differently;
+    that case is rare and is handed back to the two sequential passes.
+    """
+    chained = False
+
+    def repl(m: re.Match) -> str:
+        nonlocal chained
+        if text.startswith(PDFRegexes.DASH_NEWLINES, m.end()):
+            chained = True
+        a, dash, b = m.group(1, 2, 3)
+        return a + b if dash == "-" and "a" <= b <= "z" else f"{a} {b}"
+
+    joined = PDFRegexes.LINE_BREAK.sub(repl, text)
+    if not chained:
+        return joined
+    if "-\n" in text:
+        text = PDFRegexes.HYPHEN_BREAK.sub(r"\1\2", text)
+    return PDFRegexes.DASH_BREAK.sub(r"\1 \2", text)
+
+
+def _fuse_patterns(patterns: List[re.Pattern]) -> re.Pattern:
+    """One alternation that searches like ``any(p.search(s) for p in patterns)``.
+
+    Each branch keeps its own IGNORECASE setting via a scoped ``(?i:...)`` group.
+    """
+    return re.compile(
+        "|".join(f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})" for p in patterns)
+    )
+
+
+def _may_start_heading(line: str) -> bool:
+    """Cheap pre-check: a heading starts with a digit or an ASCII capital.
+
+    normalize_text only maps spaces, dashes and lowercase ligatures, so this holds
+    on the raw line and body text can be dropped before any normalisation.
+    """
+    head = line.lstrip()[:1]
+    return head.isdecimal() or "A" <= head <= "Z"
+
+
+def _may_hold_caption(text: str) -> bool:
+    """str-only equivalent of PDFRegexes.CAPTION_WORD_HINT.search (never misses a hit).
+
+    Deleting whitespace and lowercasing turns "T a b l e" into "table"; under re.I only the
+    "i" of Figure also matches non-ASCII letters (U+0130/U+0131), which goes to the regex.
+    """
+    squeezed = "".join(text.split()).lower()
+    if "table" in squeezed or "figure" in squeezed:
+        return True
+    if "\u0130" in text or "\u0131" in text:
+        return PDFRegexes.CAPTION_WORD_HINT.search(text) is not None
+    return False
+
+
+def _build_caption_hint_db() -> object:
+    """Compile a Hyperscan database flagging text that may hold a Table/Figure word, or None.
+
+    Any non-word gap is allowed between the letters, which is looser than the whitespace
+    gap of PDFRegexes.CAPTION_WORD_HINT. Hyperscan's caseless matching only agrees with
+    re.I on ASCII text, so its hits are a prefilter; see _caption_hints.
+    """
+    if _hyperscan is None:
+        return None
+    try:
+        db = _hyperscan.Database()
+        flags = _hyperscan.HS_FLAG_CASELESS | _hyperscan.HS_FLAG_UTF8 | _hyperscan.HS_FLAG_UCP
+        db.compile(
+            expressions=[rb"t\W*a\W*b\W*l\W*e", rb"f\W*i\W*g\W*u\W*r\W*e"],
+            ids=[0, 1],
+            elements=2,
+            flags=[flags, flags],
+        )
+        return db
+    except Exception:
+        LOG.debug("Hyperscan caption hint database unavailable; using str checks", exc_info=True)
+        return None
+
+
+_CAPTION_HINT_DB = _build_caption_hint_db()
+
+
+def _caption_hints_hyperscan(db: object, contents: List[str]) -> List[bool]:
+    """One Hyperscan pass over all chunk contents; True where a chunk may hold a caption."""
+    encoded = [c.encode("utf-8") for c in contents]
+    starts: List[int] = []
+    offset = 0
+    for raw in encoded:
+        starts.append(offset)
+        offset += len(raw) + 1
+    hits = [False] * len(contents)
+
+    def on_match(pid: int, start: int, end: int, flags: int, ctx: object) -> None:
+        hits[bisect.bisect_right(starts, end - 1) - 1] = True
+
+    db.scan(b"\0".join(encoded), match_event_handler=on_match)
+    return hits
+
+
+def _caption_hints(contents: List[str]) -> List[bool]:
+    """True where a chunk may hold a caption; never False where _may_hold_caption is True.
+
+    Hyperscan folds case differently from re.I on some non-ASCII letters (it misses
+    U+0130/U+0131 for the "i" of Figure), so non-ASCII chunks it leaves unflagged are
+    re-checked with _may_hold_caption.
+    """
+    if _CAPTION_HINT_DB is not None:
+        try:
+            hits = _caption_hints_hyperscan(_CAPTION_HINT_DB, contents)
+        except Exception:  # e.g. lone surrogates from a broken text layer
+            pass
+        else:
+            return [hit or (not c.isascii() and _may_hold_caption(c)) for hit, c in zip(hits, contents)]
+    return [bool(c) and _may_hold_caption(c) for c in contents]
+
+
+def _sentence_spacing_repl(m: re.Match) -> str:
+    return m.group("punct") or " "
+
+
+def _caption_norm_repl(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind in ("ws", "nbsp"):
+        return " "
+    if kind == "dash":
+        return "-"
+    spaced = m.group("spaced")
+    word = m.group("glued") if spaced is None else ("Table" if spaced[0] in "Tt" else "Figure")
+    return word if m.group("gap") is None else word + " "
+
+
+@lru_cache(maxsize=4096)
+def _section_sort_key(section_id: str) -> Tuple[Tuple[int, int], ...]:
+    """Order "6.4.1" numerically; lettered annex parts ("A.1") sort after every numbered chapter."""
+    return tuple((0, int(p)) if p.isdigit() else (1, ord(p[:1] or "\0")) for p in section_id.split("."))
+
+
+@lru_cache(maxsize=8192)
+def _norm_caption_line(s: str) -> str:
+    return PDFRegexes.CAPTION_NORM.sub(_caption_norm_repl, s).strip()
+
+
+@lru_cache(maxsize=4096)
+def _looks_like_running_header(s: str) -> bool:
+    norm = s.translate(PDFRegexes.HEADER_NOISE_TABLE).lower()
+    return any(
+        term in norm for term in ("universalserialbuspowerdeliveryspecification", "revision32", "version11")
     )
-    BULLET_CHARS = ("", "", "●", "▪", "", "", "", "•")
 
 
 class AbstractCleaner(ABC):
@@ -73,40 +289,34 @@ class Cleaner(AbstractCleaner):
         return isinstance(other, Cleaner)
 
     def norm_caption_line(self, s: str) -> str:
-        s = self.regex.NBSP_FIX.sub(" ", s)
-        s = self.regex.DASH_NORMALIZE.sub("-", s)
-        s = re.sub(r"(?i)\bT\s*a\s*b\s*l\s*e\b", "Table", s)
-        s = re.sub(r"(?i)\bF\s*i\s*g\s*u\s*r\s*e\b", "Figure", s)
-        s = re.sub(rf"(?i)(Table){PDFRegexes.TABLE_FIGURE_LOOKAHEAD}", r"\1 ", s)
-        s = re.sub(rf"(?i)(Figure){PDFRegexes.TABLE_FIGURE_LOOKAHEAD}", r"\1 ", s)
-        s = self.regex.MULTI_SPACE_RE.sub(" ", s).strip()
-        return s
+        # caption lines recur between the lists of figures/tables and the body
+        return _norm_caption_line(s)
 
     def looks_like_running_header_noisy(self, s: str) -> bool:
-        norm = re.sub(r"[\s.\-·•_]", "", s).lower()
-        return any(
-            term in norm for term in ("universalserialbuspowerdeliveryspecification", "revision32", "version11")
-        )
+        # heading candidates repeat on every page, so the check is memoised per line
+        return _looks_like_running_header(s)
 
     def clean_content(self, text: str) -> str:
         """Normalize PDF-extracted page content."""
         if not text:
             return ""
-        for b in self.regex.BULLET_CHARS:
-            text = text.replace(b, "- ")
-        text = re.sub(r"(\S)-\n([a-z])", r"\1\2", text)
-        text = re.sub(r"(\S)[\-\u2010-\u2014\u2212]\n(\S)", r"\1 \2", text)
-        text = text.replace('\\"', '"').replace("\\'", "'")
-        text = re.sub(r"(?<!\w)/(?!\w)", "", text)
-        text = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text)
-        text = re.sub(r'\s*"([^"]+)"\s*', r' "\1" ', text)
+        text = text.translate(self.regex.BULLET_TABLE)
+        # each whole-text pass is skipped when the literal it needs is absent (a C-level
+        # substring scan, far cheaper than a regex pass that finds nothing)
+        if any(d in text for d in self.regex.DASH_NEWLINES):
+            text = _join_line_breaks(text)
+        if "\\" in text:
+            text = text.replace('\\"', '"').replace("\\'", "'")
+        if "/" in text:
+            text = self.regex.LONE_SLASH.sub("", text)
+        text = self.regex.CAMEL_SPLIT.sub(r"\1 \2", text)
+        if '"' in text:
+            text = self.regex.QUOTE_PAD.sub(r' "\1" ', text)
 
         cleaned_lines: List[str] = []
+        line_noise = PDFRegexes.LINE_NOISE.sub
         for line in text.splitlines():
-            s = line.rstrip()
-            s = PDFRegexes.TRAILING_LEADERS_PAGE.sub("", s)
-            s = PDFRegexes.DOT_LEADERS_RUN.sub(" ", s)
-            s = PDFRegexes.MULTI_SPACE_RE.sub(" ", s).strip()
+            s = line_noise(_line_noise_repl, line.rstrip()).strip()
             if s:
                 cleaned_lines.append(s)
         return "\n".join(cleaned_lines).strip()
@@ -120,10 +330,7 @@ class Cleaner(AbstractCleaner):
     def normalize_sentences(text: str) -> str:
         if not text:
             return ""
-        text = re.sub(r"\n+", " ", text)
-        text = re.sub(r"\s+([,.])", r"\1", text)
-        text = PDFRegexes.MULTI_SPACE_RE.sub(" ", text).strip()
-        return text.strip()
+        return PDFRegexes.SENTENCE_SPACING.sub(_sentence_spacing_repl, text).strip()
 
 
 class HeadingDetector:
@@ -137,17 +344,18 @@ class HeadingDetector:
             PDFRegexes.PAGE_NO_NOISY,
             PDFRegexes.USB_SPEC_PATTERN,
         ]
+        self._noise_re = _fuse_patterns(self.noise_patterns)
 
     def __str__(self) -> str:
         return f"HeadingDetector(cleaner={self.cleaner})"
 
     def _heading_is_noisy(self, line: str, title: str) -> bool:
         """Return True if a heading is noisy."""
-        if any(pat.search(title) or pat.search(line) for pat in self.noise_patterns):
+        if self._noise_re.search(title) or self._noise_re.search(line):
             return True
         if self.cleaner.looks_like_running_header_noisy(title):
             return True
-        if not re.search(r"[A-Za-z]", title):
+        if not PDFRegexes.HAS_LETTER.search(title):
             return True
         return not looks_like_heading(num=title, title=title)
 
@@ -157,12 +365,17 @@ class HeadingDetector:
         toc_ids: Optional[Set[str]] = None,
         toc_map: Optional[Dict[str, str]] = None,
     ) -> Optional[Tuple[str, str]]:
+        if not _may_start_heading(line):
+            return None
         s = normalize_text(line)
-        m = PDFRegexes.HEADING_RE.match(s)
+        if not s:
+            return None
+        heading_re = PDFRegexes.HEADING_ALPHA_RE if "A" <= s[0] <= "Z" else PDFRegexes.HEADING_NUM_RE
+        m = heading_re.match(s)
         if not m:
             return None
-        num, raw_title = m.group("num"), m.group("title").strip()
-        title = self.cleaner.clean_heading_title(raw_title)
+        num, raw_title = m.groups()
+        title = self.cleaner.clean_heading_title(raw_title.strip())
 
         if self._heading_is_noisy(s, title):
             return None
@@ -181,11 +394,16 @@ class HeadingDetector:
     ) -> List[Tuple[int, str, str]]:
         skip_pages = skip_pages or set()
         heads: List[Tuple[int, str, str]] = []
+        # running headers/footers repeat on every page; toc_ids/toc_map are fixed for the call
+        seen: Dict[str, Optional[Tuple[str, str]]] = {}
         for pno, text in pages:
             if pno in skip_pages:
                 continue
-            for line in (text or "").splitlines():
-                heading = self.extract_heading(line, toc_ids, toc_map)
+            for line in filter(_may_start_heading, (text or "").splitlines()):
+                if line in seen:
+                    heading = seen[line]
+                else:
+                    heading = seen[line] = self.extract_heading(line, toc_ids, toc_map)
                 if heading:
                     heads.append((pno, *heading))
         return heads
@@ -215,12 +433,18 @@ class AbstractChunkBuilder(ABC):
         raise NotImplementedError
 
 
+def _finalize_chunks_worker(builder: "ChunkBuilder", items: List[_ChunkItem]) -> List[Chunk]:
+    """Process-pool entry point: clean, enrich and normalise one contiguous run of chunks."""
+    return builder._finalize_chunks(items)
+
+
 class ChunkBuilder(AbstractChunkBuilder):
     """Build chunks from pages using ToC or detected headings."""
 
-    def __init__(self, cleaner: AbstractCleaner, detector: HeadingDetector):
+    def __init__(self, cleaner: AbstractCleaner, detector: HeadingDetector, workers: Optional[int] = None):
         self.cleaner = cleaner
         self.detector = detector
+        self.workers = max(1, workers if workers is not None else min(os.cpu_count() or 1, MAX_CHUNK_WORKERS))
 
     def __str__(self) -> str:
         return f"ChunkBuilder(cleaner={self.cleaner}, detector={self.detector})"
@@ -228,29 +452,37 @@ class ChunkBuilder(AbstractChunkBuilder):
 
     def _filter_content_line(self, line: str) -> bool:
         s = line.strip()
-        if re.search(r"\b(Table|Figure)\b", s, re.IGNORECASE):
+        head = s[:1]
+        # a line can only be dropped when it starts with a digit or "Page", or carries the
+        # spec header; "power del" has no letter with a non-ASCII case variant under re.I
+        if not (head.isdecimal() or head == "P" or head == "p") and "power del" not in s.lower():
             return True
-        if re.match(r"^\d+(?:\.\d+)*\s+.+", s):
-            return False
-        if PDFRegexes.USB_SPEC_PATTERN.search(s):
-            return False
-        if re.match(r"^Page\s+\d+\s*$", s, re.I):
-            return False
-        return True
-
-    def _lines_for_page_range(
-        self, page_map: Dict[int, str], pstart: int, pend: int, skip_pages: Set[int]
-    ) -> List[str]:
+        m = PDFRegexes.CONTENT_LINE_FILTER.match(s)
+        return m is None or m.lastgroup == "keep"
+
+    def _prefilter_pages(self, pages: List[Tuple[int, str]], skip_pages: Set[int]) -> _PageLines:
+        """Split and filter every kept page once, so overlapping ranges reuse the work.
+
+        Returns ``(base, rows)`` with ``rows[p - base]`` holding page ``p``'s kept lines;
+        missing and skipped pages are empty. A repeated page number keeps its last text.
+        """
+        if not pages:
+            return 0, []
+        base = min(p for p, _ in pages)
+        rows: List[List[str]] = [[]] * (max(p for p, _ in pages) - base + 1)
+        keep = self._filter_content_line
+        for p, text in pages:
+            if p not in skip_pages:
+                rows[p - base] = [line for line in text.splitlines() if keep(line)]
+        return base, rows
+
+    def _lines_for_page_range(self, prefiltered: _PageLines, pstart: int, pend: int) -> List[str]:
         """Gather filtered lines across a page range."""
-        lines: List[str] = []
-        for p in range(pstart, pend + 1):
-            if p in skip_pages:
-                continue
-            page_text = page_map.get(p, "")
-            for line in page_text.splitlines():
-                if self._filter_content_line(line):
-                    lines.append(line)
-        return lines
+        base, rows = prefiltered
+        lo, hi = max(pstart - base, 0), pend - base + 1
+        if hi <= lo:
+            return []
+        return list(chain.from_iterable(rows[lo:hi]))
 
     def _build_chunk(self, lines: List[str], section_id: str, title: str, pstart: int, pend: int) -> Chunk:
         content = self.cleaner.clean_content("\n".join(lines))
@@ -258,30 +490,60 @@ class ChunkBuilder(AbstractChunkBuilder):
             section_path=f"{section_id} {title}",
             section_id=section_id,
             title=title,
-            page_range=f"{pstart},{pend}",
+            page_range=(pstart, pend),
             content=content,
             tables=[],
             figures=[],
         )
 
-    def _build_chunks_from_bounds(self, bounds: List[Tuple[int, int, str, str]], page_map: Dict[int, str], skip_pages: Set[int]) -> List[Chunk]:
-        """Common logic to build chunks from bounds."""
-        chunks = []
-        for pstart, pend, sec, title in bounds:
-            lines = self._lines_for_page_range(page_map, pstart, pend, skip_pages)
-            chunks.append(self._build_chunk(lines, sec, title, pstart, pend))
+    def _finalize_chunks(self, items: List[_ChunkItem]) -> List[Chunk]:
+        chunks = [self._build_chunk(lines, sec, title, pstart, pend) for lines, sec, title, pstart, pend in items]
         self.enrich_with_figures_tables(chunks)
         for ch in chunks:
             ch.content = self.cleaner.normalize_sentences(ch.content)
         return chunks
 
+    def _finalize_chunks_parallel(self, items: List[_ChunkItem]) -> List[Chunk]:
+        """Spread chunk post-processing over worker processes in contiguous, order-preserving runs.
+
+        Workers are spawned, not forked: the orchestrator runs this while another
+        thread may be inside a PDF backend or holding the logging lock.
+        """
+        workers = min(self.workers, len(items))
+        step = -(-len(items) // workers)
+        runs = [items[k:k + step] for k in range(0, len(items), step)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = pool.map(_finalize_chunks_worker, [self] * len(runs), runs)
+            return list(chain.from_iterable(parts))
+
+    def _build_chunks_from_bounds(self, bounds: List[Tuple[int, int, str, str]], pages: List[Tuple[int, str]], skip_pages: Set[int]) -> List[Chunk]:
+        """Common logic to build chunks from bounds.
+
+        Chunks are independent once their lines are gathered, so large documents
+        are cleaned in worker processes; any pool failure falls back to serial.
+        """
+        prefiltered = self._prefilter_pages(pages, skip_pages)
+        items = [
+            (self._lines_for_page_range(prefiltered, pstart, pend), sec, title, pstart, pend)
+            for pstart, pend, sec, title in bounds
+        ]
+        if self.workers > 1 and len(items) >= PARALLEL_MIN_CHUNKS:
+            try:
+                return self._finalize_chunks_parallel(items)
+            except Exception:
+                LOG.warning("Parallel chunk finalisation failed; falling back to serial", exc_info=True)
+        return self._finalize_chunks(items)
+
     def enrich_with_figures_tables(self, chunks: List[Chunk]) -> None:
-        for ch in chunks:
+        contents = [ch.content or "" for ch in chunks]
+        for ch, candidate in zip(chunks, _caption_hints(contents)):
             ch.figures = []
             ch.tables = []
-            if not ch.content:
+            if not candidate:
                 continue
             for line in ch.content.splitlines():
+                if not _may_hold_caption(line):
+                    continue
                 ln = self.cleaner.norm_caption_line(line)
                 if m := PDFRegexes.FIGURE_RE.search(ln):
                     ch.figures.append(Caption(id=m.group(1)))
@@ -293,7 +555,6 @@ class ChunkBuilder(AbstractChunkBuilder):
         self, pages: List[Tuple[int, str]], toc_entries: List[ToCEntry], skip_pages: Optional[Set[int]] = None
     ) -> List[Chunk]:
         skip_pages = skip_pages or set()
-        page_map = dict(pages)
         entries_sorted = sorted(toc_entries, key=lambda e: e.page)
         last_pdf_page = pages[-1][0] if pages else 0
 
@@ -304,7 +565,7 @@ class ChunkBuilder(AbstractChunkBuilder):
             pend = max(pstart, pend)
             bounds.append((pstart, pend, e.section_id, e.title))
 
-        return self._build_chunks_from_bounds(bounds, page_map, skip_pages)
+        return self._build_chunks_from_bounds(bounds, pages, skip_pages)
 
     def build_chunks(
         self, pages: List[Tuple[int, str]], toc_ids: Optional[Set[str]] = None, skip_pages: Optional[Set[int]] = None, toc_map: Optional[Dict[str, str]] = None
@@ -315,40 +576,28 @@ class ChunkBuilder(AbstractChunkBuilder):
             return []
 
         last_page = pages[-1][0]
-        heads_sorted = sorted(heads, key=lambda x: (tuple(int(p) for p in x[1].split(".")), x[0]))
+        heads_sorted = sorted(heads, key=lambda x: (_section_sort_key(x[1]), x[0]))
 
         bounds: List[Tuple[int, int, str, str]] = []
         for i, (pno, sec, title) in enumerate(heads_sorted):
             next_p = heads_sorted[i + 1][0] if i + 1 < len(heads_sorted) else last_page + 1
             bounds.append((pno, next_p - 1, sec, title))
 
-        page_map = dict(pages)
-        return self._build_chunks_from_bounds(bounds, page_map, skip_pages)
+        return self._build_chunks_from_bounds(bounds, pages, skip_pages)
+
+    @staticmethod
+    def _chunk_record(c: Chunk) -> Dict[str, object]:
+        return {
+            "section_path": c.section_path,
+            "start_heading": f"{c.section_id} {c.title}",
+            "content": c.content,
+            "tables": [f"Table {t.id}" for t in (c.tables or [])],
+            "figures": [f"Figure {fg.id}" for fg in (c.figures or [])],
+            "page_range": list(c.page_range) if c.page_range else [],
+        }
 
     def write_jsonl(self, chunks: List[Chunk], out_path: str) -> int:
-        out_file = Path(out_path)
-        out_file.parent.mkdir(parents=True, exist_ok=True)
-        count = 0
-        with out_file.open("w", encoding="utf-8") as fh:
-            for c in chunks:
-                pr_list: List[int] = []
-                try:
-                    parts = [p.strip() for p in (c.page_range or "").split(",") if p.strip()]
-                    pr_list = [int(x) for x in parts] if parts else []
-                except Exception:
-                    pr_list = []
-
-                obj = {
-                    "section_path": c.section_path,
-                    "start_heading": f"{c.section_id} {c.title}",
-                    "content": c.content,
-                    "tables": [f"Table {t.id}" for t in (c.tables or [])],
-                    "figures": [f"Figure {fg.id}" for fg in (c.figures or [])],
-                    "page_range": pr_list,
-                }
-                fh.write(json.dumps(obj, ensure_ascii=False) + "\n")
-                count += 1
-        return count
+        return write_jsonl_records(map(self._chunk_record, chunks), out_path)
 
 
 _cleaner: AbstractCleaner = Cleaner()
@@ -364,12 +613,20 @@ def enrich_with_figures_tables(chunks: List[Chunk]) -> None:
     _builder.enrich_with_figures_tables(chunks)
 
 
+def _builder_for(workers: Optional[int]) -> AbstractChunkBuilder:
+    """The shared builder, or one with its own worker-process count (1 = serial)."""
+    if workers is None:
+        return _builder
+    return ChunkBuilder(_cleaner, _detector, workers=workers)
+
+
 def build_chunks_from_toc(
     pages: List[Tuple[int, str]],
     toc_entries: List[ToCEntry],
     skip_pages: Optional[Set[int]] = None,
+    workers: Optional[int] = None,
 ) -> List[Chunk]:
-    return _builder.build_chunks_from_toc(pages, toc_entries, skip_pages=skip_pages)
+    return _builder_for(workers).build_chunks_from_toc(pages, toc_entries, skip_pages=skip_pages)
 
 
 def build_chunks(
@@ -377,8 +634,9 @@ def build_chunks(
     toc_ids: Optional[Set[str]] = None,
     skip_pages: Optional[Set[int]] = None,
     toc_map: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
 ) -> List[Chunk]:
-    return _builder.build_chunks(
+    return _builder_for(workers).build_chunks(
         pages, toc_ids=toc_ids, skip_pages=skip_pages, toc_map=toc_map
     )
 
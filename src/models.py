@@ -1,5 +1,5 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Any, Optional, List, Tuple
+from pydantic import BaseModel, Field, field_validator
 
 
 class Caption(BaseModel):
@@ -21,11 +21,22 @@ class Chunk(BaseModel):
     section_path: str
     section_id: Optional[str] = None
     title: str
-    page_range: str
+    page_range: Optional[Tuple[int, int]]
     content: str
     tables: List[Caption] = Field(default_factory=list)
     figures: List[Caption] = Field(default_factory=list)
 
+    @field_validator("page_range", mode="before")
+    @classmethod
+    def _parse_page_range(cls, v: Any) -> Any:
+        """Accept the legacy "start,end" string form; empty or malformed strings become None."""
+        if not isinstance(v, str):
+            return v
+        parts = [p.strip() for p in v.split(",") if p.strip()]
+        if len(parts) != 2 or not all(p.isdecimal() for p in parts):
+            return None
+        return int(parts[0]), int(parts[1])
+
 
 class ValidationReport(BaseModel):
     toc_section_count: int
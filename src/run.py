@@ -151,14 +151,17 @@ class ChunkCommand(AbstractCommand):
                         "Filtered %d ToC entries inside ToC pages", before - after
                     )
 
+        # worker-process count for chunk post-processing; unset keeps the builder default
+        workers = getattr(args, "workers", None)
+        build_kwargs = {"workers": workers} if workers is not None else {}
         if toc_entries:
             chunks = self.build_chunks_from_toc(
-                pages, toc_entries, skip_pages=skip_pages
+                pages, toc_entries, skip_pages=skip_pages, **build_kwargs
             )
             self.log.debug("Built %d chunks using provided ToC", len(chunks))
         else:
             chunks = self.build_chunks(
-                pages, toc_ids=None, skip_pages=skip_pages, toc_map=None
+                pages, toc_ids=None, skip_pages=skip_pages, toc_map=None, **build_kwargs
             )
             self.log.debug("Built %d chunks using automatic chunking", len(chunks))
 
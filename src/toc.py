@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-import json
 import re
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Iterable, List, Tuple, Dict, Optional
 
 from src.logger import get_logger
 from src.models import ToCEntry
-from src.utils import normalize_text, strip_dot_leaders
+from src.utils import normalize_text, strip_dot_leaders, write_jsonl_records
 
 LOG = get_logger(__name__)
 
@@ -236,12 +234,6 @@ def parse_toc_lines(
 
 def write_jsonl(entries: List[ToCEntry], out_path: str) -> int:
     """Write ToCEntry objects to a JSONL file and return the written count."""
-    out_file = Path(out_path)
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    count = 0
-    with out_file.open("w", encoding="utf-8") as fh:
-        for e in entries:
-            fh.write(json.dumps(e.model_dump(), ensure_ascii=False) + "\n")
-            count += 1
+    count = write_jsonl_records((e.model_dump() for e in entries), out_path)
     LOG.info("Wrote %d ToC entries to %s", count, out_path)
     return count
@@ -15,14 +15,22 @@ Refactor notes:
 
 from abc import ABC, abstractmethod
 import io
+import json
 import re
 import importlib
-from typing import Generator, List, Optional, Tuple, Iterable, Dict, Any
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Generator, List, Optional, Tuple, Iterable, Dict, Any, Union
 
 from src.logger import get_logger
 
 LOG = get_logger(__name__)
 
+# PyMuPDF is not thread-safe; every MuPDF call (open, page load, text extraction,
+# close) is made while holding this lock, here and in the orchestrator's reader.
+PYMUPDF_LOCK = threading.RLock()
+
 
 class AbstractPDFUtils(ABC):
     """Abstract contract for PDF utilities."""
@@ -83,8 +91,17 @@ class PDFUtils(AbstractPDFUtils):
 
     DOT_LEADERS_RX = re.compile(r"\.{3,}")
 
-    NBSP_RX = re.compile(r"[\u00A0\u202F]")
-    DASH_RX = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2212]")
+    SPACE_TAB_RX = re.compile(r"[ \t]+")
+    PAGE_RANGE_RX = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+    BINARY_RUN_RX = re.compile(r"\b[01]{4,}\b")
+    # NBSP -> " ", dashes -> "-" and LIGATURES in one str.translate pass (all keys are single chars)
+    NORMALIZE_TABLE = str.maketrans(
+        {
+            **dict.fromkeys("\u00A0\u202F", " "),
+            **dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2212", "-"),
+            **LIGATURES,
+        }
+    )
 
     def __init__(self) -> None:
         pass
@@ -105,11 +122,8 @@ class PDFUtils(AbstractPDFUtils):
         """Replace ligatures and normalize spaces and dash/nbsp variants."""
         if not s:
             return ""
-        s = self.NBSP_RX.sub(" ", s)
-        s = self.DASH_RX.sub("-", s)
-        for k, v in self.LIGATURES.items():
-            s = s.replace(k, v)
-        s = re.sub(r"[ \t]+", " ", s)
+        s = s.translate(self.NORMALIZE_TABLE)
+        s = self.SPACE_TAB_RX.sub(" ", s)
         return s.strip()
 
     def strip_dot_leaders(self, s: str) -> str:
@@ -163,7 +177,7 @@ class PDFUtils(AbstractPDFUtils):
 
     def parse_page_range(self, s: str) -> Tuple[int, int]:
         """Parse a string like '13-18' into a tuple of integers."""
-        m = re.match(r"^\s*(\d+)\s*-\s*(\d+)\s*$", s or "")
+        m = self.PAGE_RANGE_RX.match(s or "")
         if not m:
             raise ValueError("Page range must be like '13-18'")
         return int(m.group(1)), int(m.group(2))
@@ -218,12 +232,22 @@ class PDFUtils(AbstractPDFUtils):
         LOG.debug("Extracting all pages from %s using PyMuPDF", pdf_path)
         pages: List[Tuple[int, str]] = []
         try:
-            with fitz.open(pdf_path) as doc:
-                for page_no, page in enumerate(doc, start=1):
-                    blocks = page.get_text("blocks")
+            with PYMUPDF_LOCK:
+                doc = fitz.open(pdf_path)
+                n_pages = doc.page_count
+            try:
+                # the lock is taken per page so other threads' MuPDF work can interleave
+                for page_no in range(1, n_pages + 1):
+                    with PYMUPDF_LOCK:
+                        page = doc.load_page(page_no - 1)
+                        blocks = page.get_text("blocks")
+                        del page
                     blocks = sorted(blocks, key=lambda b: (b[1], b[0]))  # sort top-down
                     text = "\n".join(b[4] for b in blocks if b[4].strip())
                     pages.append((page_no, text))
+            finally:
+                with PYMUPDF_LOCK:
+                    doc.close()
         except Exception as exc:
             LOG.exception("extract_all_pages failed for %s: %s", pdf_path, exc)
         LOG.debug("Extracted %d pages from %s", len(pages), pdf_path)
@@ -240,7 +264,7 @@ class PDFUtils(AbstractPDFUtils):
         digits = sum(c.isdigit() for c in t)
         if letters == 0 or digits > letters:
             return False
-        if re.search(r"\b[01]{4,}\b", t):
+        if self.BINARY_RUN_RX.search(t):
             return False
         return True
 
@@ -305,3 +329,47 @@ def looks_like_heading(num: str, title: str) -> bool:
     except Exception as e:
         LOG.error("looks_like_heading failed: %s", e, exc_info=True)
         return False
+
+
+JSONL_READ_BUFFER = 1 << 20
+JSONL_WRITE_BUFFER = 1 << 20
+JSONL_WRITE_BATCH = 1000
+
+_orjson = _lazy_import("orjson")
+
+
+def dumps_jsonl_line(obj: Any) -> bytes:
+    """Serialize one record as a UTF-8 JSONL line (orjson when installed, else stdlib json)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """Decode one JSON document (orjson when installed, else stdlib json).
+
+    orjson is stricter (e.g. no NaN literals); such lines are retried with json.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def write_jsonl_records(records: Iterable[Dict[str, Any]], out: Union[str, Path]) -> int:
+    """Write records as JSONL to a path through a buffered binary file.
+
+    Returns the number of records written.
+    """
+    count = 0
+    out_file = Path(out)
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    it = iter(records)
+    with out_file.open("wb", buffering=JSONL_WRITE_BUFFER) as fh:
+        # serialize in blocks and hand each block to the file as one joined write
+        while block := list(islice(it, JSONL_WRITE_BATCH)):
+            fh.write(b"".join(map(dumps_jsonl_line, block)))
+            count += len(block)
+    return count
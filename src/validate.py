@@ -13,7 +13,7 @@ from rich.table import Table
 
 from src.logger import get_logger
 from src.models import Caption, Chunk, ToCEntry, ValidationReport
-from src.utils import normalize_text, strip_dot_leaders
+from src.utils import JSONL_READ_BUFFER, loads_json, normalize_text, strip_dot_leaders
 
 LOG = get_logger(__name__)
 CONSOLE = Console()
@@ -41,21 +41,31 @@ FUZZY_BRAND_RX = re.compile(
 
 ISOLATED_LETTERS_RUN_RX = re.compile(r"(?:\b[A-Za-z]\b[.\s]*){6,}")
 DOT_LEADERS_RX = re.compile(r"(?:\s*[.\u00B7•\u2022]\s*){3,}")
-NBSP_RX = re.compile(r"[\u00A0\u202F]")
-DASH_RX = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2212]")
+# section IDs: drop NBSP variants, map unicode dashes to "-"
+ID_NORMALIZE_TABLE = str.maketrans(
+    {**dict.fromkeys("\u00A0\u202F", None), **dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2212", "-")}
+)
 HEADING_NUM_TITLE_RX = re.compile(r"^\s*\d+(?:[.\-]\d+)*\s+(?P<title>.+?)\s*$")
+HAS_LETTER_RX = re.compile(r"[A-Za-z]")
+TRAILING_PAGE_LIST_RX = re.compile(r"[,;]\s*(?:\d[\s.\-]*){2,}$")
+MULTI_SPACE_RX = re.compile(r"\s{2,}")
+TITLE_NOISE_CHARS_RX = re.compile(r"[\s.\-]+")
+ALPHA_WORD_RX = re.compile(r"\b[A-Za-z]{3,}\b")
 
 def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
-    """Yield parsed JSON objects from a JSONL file (streaming)."""
-    with path.open("r", encoding="utf-8") as fh:
+    """Yield parsed JSON objects from a JSONL file (streaming).
+
+    The file is read as bytes through a large buffer and decoded by the JSON
+    parser directly, skipping the text-layer utf-8 decode.
+    """
+    with path.open("rb", buffering=JSONL_READ_BUFFER) as fh:
         for line in fh:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
-                yield json.loads(line)
+                yield loads_json(line)
             except Exception:
-                LOG.exception("Skipping malformed JSON line in %s: %s", path, line[:200])
+                LOG.exception("Skipping malformed JSON line in %s: %r", path, line[:200])
 
 
 def _short_chunk_repr(obj: Dict[str, Any], max_title: int = 80) -> str:
@@ -78,9 +88,7 @@ def _norm_id(s: str) -> str:
     """Normalise dash/nbsp characters for section IDs (keeps digits/letters intact)."""
     if not s:
         return ""
-    s = NBSP_RX.sub("", s)
-    s = DASH_RX.sub("-", s)
-    return s.strip()
+    return s.translate(ID_NORMALIZE_TABLE).strip()
 
 
 def _lev_ratio(a: str, b: str) -> float:
@@ -178,7 +186,7 @@ class Validator(AbstractValidator):
                 LOG.exception("Failed to parse ToC record (skipping): %s", str(obj)[:200])
                 continue
             e.title = self._clean_toc_title(e.title)
-            if not e.title or not re.search(r"[A-Za-z]", e.title):
+            if not e.title or not HAS_LETTER_RX.search(e.title):
                 continue
             vals.append(e)
         LOG.info("Loaded %d ToC entries from %s", len(vals), path)
@@ -204,7 +212,7 @@ class Validator(AbstractValidator):
     def _load_single_chunk(self, obj: Dict[str, Any]) -> Chunk:
         """Coerce a JSON object into a Chunk model, accommodating legacy formats."""
         try:
-            if "title" in obj and "section_id" in obj and isinstance(obj.get("page_range"), str):
+            if "title" in obj and "section_id" in obj and isinstance(obj.get("page_range"), (str, list)):
                 return Chunk.model_validate(obj)
         except Exception:
             LOG.debug("Preserving coercion path for chunk record (legacy-like)")
@@ -212,7 +220,7 @@ class Validator(AbstractValidator):
         coerced = self._coerce_export_record_to_chunk(obj)
         return Chunk.model_validate(coerced)
 
-    def _extract_chunk_info(self, obj: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    def _extract_chunk_info(self, obj: Dict[str, Any]) -> Tuple[str, str, str, Any, str]:
         """Return (section_path, section_id, title, page_range, content) for a legacy or modern chunk record."""
         section_path = obj.get("section_path") or obj.get("start_heading") or ""
         if " " in section_path:
@@ -223,11 +231,11 @@ class Validator(AbstractValidator):
         content = obj.get("content", "")
         pr = obj.get("page_range", "")
         if isinstance(pr, list) and len(pr) == 2:
-            page_range = f"{int(pr[0])},{int(pr[1])}"
+            page_range = (int(pr[0]), int(pr[1]))
         elif isinstance(pr, str):
-            page_range = pr
+            page_range = pr  # legacy "start,end"; parsed by the Chunk model
         else:
-            page_range = ""
+            page_range = None
         return section_path, section_id, title, page_range, content
 
     def _to_captions(self, items: Any, rx: re.Pattern) -> List[Caption]:
@@ -270,10 +278,10 @@ class Validator(AbstractValidator):
         m = HEADING_NUM_TITLE_RX.match(s)
         if m:
             s = m.group("title")
-        s = re.sub(r"[,;]\s*(?:\d[\s.\-]*){2,}$", "", s)
-        s = re.sub(r"\s{2,}", " ", s).strip()
+        s = TRAILING_PAGE_LIST_RX.sub("", s)
+        s = MULTI_SPACE_RX.sub(" ", s).strip()
 
-        norm = re.sub(r"[\s.\-]+", "", s).lower()
+        norm = TITLE_NOISE_CHARS_RX.sub("", s).lower()
         if "universalserialbuspowerdeliveryspecification" in norm:
             parts = s.split()
             s = " ".join(parts[:2]) if len(parts) >= 2 else (parts[0] if parts else "")
@@ -287,7 +295,7 @@ class Validator(AbstractValidator):
                 return False
             if len(content) > self.noisy_chunk_max_len:
                 return True
-            words = re.findall(r"\b[A-Za-z]{3,}\b", content)
+            words = ALPHA_WORD_RX.findall(content)
             if len(words) > 2000:
                 return True
             return False
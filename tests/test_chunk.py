@@ -0,0 +1,50 @@
+"""Tests for the caption prefilters in ``src.chunk``."""
+
+import re
+
+import pytest
+
+from src import chunk
+from src.chunk import PDFRegexes
+
+
+def _case_variants():
+    """Each caption word with one letter swapped for every character re.I equates with it."""
+    equal = {
+        letter: [ch for ch in map(chr, range(0x80, 0x10000)) if rx.fullmatch(ch)]
+        for letter in set("tablefigure")
+        for rx in [re.compile(letter, re.IGNORECASE)]
+    }
+    return [
+        f"See {word[:pos]}{ch}{word[pos + 1:]} 4.2"
+        for word in ("table", "figure")
+        for pos, letter in enumerate(word)
+        for ch in equal[letter]
+    ]
+
+
+CASES = _case_variants() + [
+    "Fİgure 3.1",
+    "FıGURE 3.1",
+    "T a b l e 2",
+    "Tab\u00a0le 2",
+    "no caption here",
+    "",
+]
+
+
+@pytest.mark.parametrize("engine", ["hyperscan", "str"])
+def test_caption_hints_never_miss_regex_hits(monkeypatch, engine):
+    if engine == "hyperscan":
+        if chunk._CAPTION_HINT_DB is None:
+            pytest.skip("hyperscan not installed")
+    else:
+        monkeypatch.setattr(chunk, "_CAPTION_HINT_DB", None)
+    assert any(not c.isascii() for c in CASES)
+    hints = chunk._caption_hints(CASES)
+    missed = [
+        c for c, hit in zip(CASES, hints)
+        if not hit and PDFRegexes.CAPTION_WORD_HINT.search(c)
+    ]
+    assert missed == []
+    assert hints[CASES.index("no caption here")] is False
@@ -0,0 +1,74 @@
+"""Tests for ``orchestrate.ExcelWriter`` and the report's locked-file fallback."""
+
+import io
+import os
+
+import pytest
+
+pytest.importorskip("xlsxwriter")
+pytest.importorskip("openpyxl")
+
+import orchestrate  # noqa: E402
+from orchestrate import ExcelWriter, Orchestrator, SingleColumnSheet  # noqa: E402
+
+SHEETS = {"Figures": SingleColumnSheet(header="figure_id", values=["1.1", "2.3"])}
+
+
+@pytest.fixture
+def locked(monkeypatch):
+    """Make one path unwritable by refusing to open it, as a file held open on Windows is.
+
+    Permission bits are not enough when the tests run as root.
+    """
+    paths = set()
+    real_open = io.open
+
+    def fake_open(file, mode="r", *args, **kwargs):
+        if str(file) in paths and any(c in mode for c in "wax+"):
+            raise PermissionError(13, "Permission denied", str(file))
+        return real_open(file, mode, *args, **kwargs)
+
+    # zipfile (used by both engines) opens the target through io.open
+    monkeypatch.setattr(io, "open", fake_open)
+    return paths
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "openpyxl"])
+def test_locked_target_raises_permission_error(tmp_path, locked, engine):
+    target = tmp_path / "report.xlsx"
+    locked.add(str(target))
+    with pytest.raises(PermissionError):
+        ExcelWriter(engine=engine).write(target, SHEETS)
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "openpyxl"])
+def test_safe_write_excel_falls_back_to_alternate(tmp_path, locked, engine):
+    target = tmp_path / "report.xlsx"
+    locked.add(str(target))
+    orch = Orchestrator(excel_writer=ExcelWriter(engine=engine))
+    orch._safe_write_excel(str(target), SHEETS)
+    assert not target.exists()
+    (alternate,) = tmp_path.glob("ValidationReport_*.xlsx")
+    assert alternate.stat().st_size > 0
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0, reason="root ignores permission bits"
+)
+def test_safe_write_excel_read_only_target(tmp_path):
+    target = tmp_path / "report.xlsx"
+    target.write_bytes(b"")
+    target.chmod(0o444)
+    Orchestrator(excel_writer=ExcelWriter(engine="xlsxwriter"))._safe_write_excel(
+        str(target), SHEETS
+    )
+    assert target.stat().st_size == 0
+    assert list(tmp_path.glob("ValidationReport_*.xlsx"))
+
+
+def test_xlsxwriter_row_error_is_not_masked(tmp_path):
+    target = tmp_path / "report.xlsx"
+    bad = {"Rows": orchestrate.RowsSheet(headers=["a"], rows=[(object(),)])}
+    with pytest.raises(TypeError):
+        ExcelWriter(engine="xlsxwriter").write(target, bad)
+    assert not target.exists()
@@ -0,0 +1,82 @@
+"""Tests for the LoF/LoT readers in ``orchestrate``."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PyPDF2")
+
+import orchestrate  # noqa: E402
+from src import utils  # noqa: E402
+
+LOF_LINES = [
+    ["List of Figures", "Figure 1.1 System overview ........ 3", "Figure 1.2 Data flow ........ 4",
+     "Figure 2.1 Block diagram ........ 9", "Figure A.1 Appendix layout ........ 40"],
+    ["Figure 3.1a Timing ........ 12", "Figure 3.10 Reset sequence ........ 14",
+     "Table 9.9 mentioned in a figure caption ........ 15"],
+]
+LOT_LINES = [
+    ["List of Tables", "Table 1.1 Register map ........ 5", "Table 2.3 Pin list ........ 10",
+     "Table B.2 Appendix values ........ 41", "Figure 8.8 mentioned in a table caption ........ 11"],
+]
+# ranges are [start, end) 0-based page indices, as in extract_from_pdf
+LOF_RANGE = (1, 3)
+LOT_RANGE = (3, 4)
+
+
+@pytest.fixture(scope="module")
+def lists_pdf(tmp_path_factory):
+    """A small PDF: a title page, two List of Figures pages and one List of Tables page."""
+    path = tmp_path_factory.mktemp("pdf") / "lists.pdf"
+    doc = fitz.open()
+    for lines in [["Specification"]] + LOF_LINES + LOT_LINES:
+        page = doc.new_page()
+        for row, line in enumerate(lines):
+            page.insert_text((72, 72 + 18 * row), line, fontsize=11)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _reader_classes():
+    classes = [orchestrate.FitzReader, orchestrate.open_pypdf2_reader]
+    if orchestrate._pdfium is not None:
+        classes.append(orchestrate.Pdfium2Reader)
+    return classes
+
+
+def test_pypdf2_finds_fixture_ids(lists_pdf):
+    ex = orchestrate.FigureTableExtractor(reader_cls=orchestrate.open_pypdf2_reader)
+    figs, tabs = ex.extract_from_pdf(lists_pdf, LOF_RANGE, LOT_RANGE)
+    assert figs == {"1.1", "1.2", "2.1", "A.1", "3.1a", "3.10"}
+    assert tabs == {"1.1", "2.3", "B.2"}
+
+
+@pytest.mark.parametrize("reader_cls", _reader_classes(), ids=lambda c: c.__name__)
+def test_readers_match_pypdf2(lists_pdf, reader_cls):
+    expected = orchestrate.FigureTableExtractor(
+        reader_cls=orchestrate.open_pypdf2_reader
+    ).extract_from_pdf(lists_pdf, LOF_RANGE, LOT_RANGE)
+    got = orchestrate.FigureTableExtractor(reader_cls=reader_cls).extract_from_pdf(
+        lists_pdf, LOF_RANGE, LOT_RANGE
+    )
+    assert got == expected
+
+
+def test_fitz_reader_alongside_extract_all_pages(lists_pdf):
+    """The LoF/LoT scan and the chunk stage's page extraction both use PyMuPDF from
+    different threads (see ``Orchestrator.run_all``); results must match serial runs."""
+    ex = orchestrate.FigureTableExtractor(reader_cls=orchestrate.FitzReader)
+    ids = ex.extract_from_pdf(lists_pdf, LOF_RANGE, LOT_RANGE)
+    pages = utils.extract_all_pages(str(lists_pdf))
+    assert len(pages) == 4
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        id_futs = [
+            pool.submit(ex.extract_from_pdf, lists_pdf, LOF_RANGE, LOT_RANGE)
+            for _ in range(20)
+        ]
+        page_futs = [pool.submit(utils.extract_all_pages, str(lists_pdf)) for _ in range(20)]
+        assert all(f.result() == ids for f in id_futs)
+        assert all(f.result() == pages for f in page_futs)